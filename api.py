@@ -13,26 +13,115 @@ Usage:
         -F "lifetime=10"
 """
 
-from typing import Optional
+import asyncio
+import io
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import BinaryIO, Callable, Hashable, Optional, Tuple, TypeVar
 
 from fastapi import FastAPI, File, Form, UploadFile, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from openpyxl import Workbook
 
 from extraction_core import (
+    ExtractionResult,
     extract_required_inputs,
     compute_kpis,
     detect_model_sheets,
-    load_workbook_sheets,
+    list_sheet_names,
+    content_digest,
 )
 
 
+def _warm_up() -> None:
+    """Run one extraction on a tiny in-memory workbook to pay one-time init costs."""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Warmup"
+    ws.append(["Annual energy consumption", "1 kWh"])
+    buf = io.BytesIO()
+    wb.save(buf)
+    extract_required_inputs(buf.getvalue(), ws.title)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the parse pool at startup so the first request skips openpyxl/pandas setup."""
+    await _run_blocking(_warm_up)
+    yield
+
+
 app = FastAPI(
     title="Mabe PaceSetter API",
     description="API for extracting sustainability inputs from Excel workbooks and computing CO2e KPIs.",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 
+# ============================================================================
+# Parse Cache
+# ============================================================================
+
+# Bounded pool for workbook hashing/parsing so it never blocks the event loop
+_PARSE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 2),
+    thread_name_prefix="workbook-parse",
+)
+
+
+async def _run_blocking(fn, *args):
+    """Run a blocking call on the parse pool and await its result."""
+    return await asyncio.get_running_loop().run_in_executor(_PARSE_EXECUTOR, fn, *args)
+
+
+_CACHE_SIZE = 32
+_T = TypeVar("_T")
+
+# Results keyed by upload digest, least recently used first
+_cache_lock = threading.Lock()
+_sheet_names_cache: "OrderedDict[bytes, Tuple[str, ...]]" = OrderedDict()
+_extract_cache: "OrderedDict[Tuple[bytes, str], ExtractionResult]" = OrderedDict()
+
+
+def _memoized(cache: OrderedDict, key: Hashable, compute: Callable[[], _T]) -> _T:
+    """
+    LRU lookup of key in cache, filled by compute() on a miss.
+    
+    Unlike lru_cache, only the key and the result are stored, so the upload
+    file a miss is computed from is not kept alive by the cache.
+    """
+    with _cache_lock:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+    value = compute()
+    with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > _CACHE_SIZE:
+            cache.popitem(last=False)
+    return value
+
+
+def _sheet_names_cached(digest: bytes, file: BinaryIO) -> Tuple[str, ...]:
+    """Sheet names for an upload, so repeat requests on the same file skip openpyxl."""
+    return _memoized(_sheet_names_cache, digest, lambda: tuple(list_sheet_names(file)))
+
+
+def _extract_cached(digest: bytes, sheet: str, file: BinaryIO) -> ExtractionResult:
+    """Extraction result for an (upload, sheet) pair. Callers must not mutate it."""
+    # The upload's digest doubles as the core's sheet cache key, so the file is hashed once
+    return _memoized(
+        _extract_cache, (digest, sheet),
+        lambda: extract_required_inputs(file, sheet, digest=digest),
+    )
+
+
 @app.get("/")
 async def root():
     """Health check endpoint."""
@@ -43,12 +132,12 @@ async def root():
 async def get_sheets(file: UploadFile = File(...)):
     """List available sheets in the workbook and detect model sheets."""
     try:
-        content = await file.read()
-        sheets = load_workbook_sheets(content)
-        model_sheets = detect_model_sheets(list(sheets.keys()))
+        digest = await _run_blocking(content_digest, file.file)
+        sheet_names = list(await _run_blocking(_sheet_names_cached, digest, file.file))
+        model_sheets = detect_model_sheets(sheet_names)
         
         return {
-            "all_sheets": list(sheets.keys()),
+            "all_sheets": sheet_names,
             "detected_model_sheets": model_sheets,
             "recommended_sheet": model_sheets[0] if model_sheets else None,
         }
@@ -73,15 +162,15 @@ async def compute(
         - kpis: Computed KPI values including totals and shares
     """
     try:
-        content = await file.read()
+        digest = await _run_blocking(content_digest, file.file)
         
         # Extract inputs
-        extraction = extract_required_inputs(content, model_sheet)
+        extraction = await _run_blocking(_extract_cached, digest, model_sheet, file.file)
         
         # Compute KPIs
         kpis = compute_kpis(extraction.inputs, grid_factor, lifetime)
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "inputs": extraction.inputs,
             "provenance": {k: v.to_dict() for k, v in extraction.provenance.items()},
             "warnings": extraction.warnings,
@@ -108,10 +197,10 @@ async def extract_only(
     Useful for previewing extraction results before computation.
     """
     try:
-        content = await file.read()
-        extraction = extract_required_inputs(content, model_sheet)
+        digest = await _run_blocking(content_digest, file.file)
+        extraction = await _run_blocking(_extract_cached, digest, model_sheet, file.file)
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "inputs": extraction.inputs,
             "provenance": {k: v.to_dict() for k, v in extraction.provenance.items()},
             "warnings": extraction.warnings,
@@ -7,9 +7,12 @@ Features:
 - Export results as CSV
 """
 
+import csv
+import io
 import re
 import time
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 
 import altair as alt
 import pandas as pd
@@ -18,11 +21,12 @@ import streamlit as st
 from extraction_core import (
     extract_required_inputs,
     compute_kpis,
-    load_workbook_sheets,
+    list_sheet_names,
     detect_model_sheets,
     Provenance,
     REQUIRED_KEYS,
 )
+from theme import ACCENT, CSS_HTML
 
 
 # ---------------------- Page Config ----------------------
@@ -34,78 +38,13 @@ st.set_page_config(
 )
 
 # ---------------------- Design System ----------------------
-BG = "#051C2C"
-ACCENT = "#00D4FF"
-TEXT = "#FFFFFF"
-TEXT_DIM = "rgba(255,255,255,0.7)"
-TEXT_MUTED = "rgba(255,255,255,0.5)"
-BORDER = "rgba(255,255,255,0.08)"
-CARD = "rgba(255,255,255,0.03)"
-
-st.markdown(f"""
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&family=Playfair+Display:wght@600;700&display=swap');
-
-.stApp {{ background-color: {BG}; }}
-.main .block-container {{ background-color: {BG}; padding-top: 2rem; }}
-
-h1 {{ font-family: 'Playfair Display', serif !important; color: {TEXT} !important; font-weight: 700 !important; }}
-h2, h3, h4 {{ font-family: 'Inter', sans-serif !important; color: {TEXT} !important; font-weight: 600 !important; }}
-p, span, label, .stMarkdown {{ font-family: 'Inter', sans-serif !important; color: {TEXT_DIM} !important; }}
-
-.step-header {{ display: flex; align-items: center; gap: 12px; margin: 1.5rem 0 1rem 0; }}
-.step-num {{ background: {ACCENT}; color: {BG}; width: 32px; height: 32px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-weight: 700; font-size: 14px; }}
-.step-title {{ font-family: 'Playfair Display', serif; font-size: 24px; font-weight: 600; color: {TEXT}; }}
-
-.input-label {{ font-family: 'Inter', sans-serif; font-size: 15px; font-weight: 600; color: {TEXT}; margin-bottom: 6px; display: flex; align-items: center; gap: 10px; }}
-.badge-ok {{ background: rgba(0, 212, 255, 0.15); color: {ACCENT}; padding: 3px 10px; border-radius: 12px; font-size: 12px; font-weight: 600; }}
-.badge-manual {{ background: rgba(255, 170, 0, 0.15); color: #FFAA00; padding: 3px 10px; border-radius: 12px; font-size: 12px; font-weight: 600; }}
-
-[data-testid="stMetricValue"] {{ color: {TEXT} !important; font-family: 'Playfair Display', serif !important; font-size: 2rem !important; }}
-[data-testid="stMetricLabel"] {{ color: {TEXT_MUTED} !important; font-family: 'Inter', sans-serif !important; text-transform: uppercase; font-size: 12px !important; }}
-
-.stButton > button {{ background: {ACCENT} !important; color: {BG} !important; border: none !important; border-radius: 8px !important; font-weight: 600 !important; transition: all 0.3s ease !important; }}
-.stButton > button:hover {{ background: #33DFFF !important; box-shadow: 0 0 25px rgba(0, 212, 255, 0.3) !important; transform: translateY(-2px) !important; }}
-
-.stDownloadButton > button {{ background: {CARD} !important; color: {TEXT} !important; border: 1px solid {BORDER} !important; border-radius: 8px !important; font-weight: 600 !important; }}
-.stDownloadButton > button:hover {{ border-color: {ACCENT} !important; color: {ACCENT} !important; }}
-
-[data-testid="stFileUploader"] {{ background: {CARD}; border: 2px dashed {BORDER}; border-radius: 12px; padding: 1rem; }}
-[data-testid="stFileUploader"]:hover {{ border-color: {ACCENT}; }}
-[data-testid="stFileUploader"] button {{ background: #4a5568 !important; color: white !important; border: none !important; border-radius: 6px !important; }}
-[data-testid="stFileUploader"] button:hover {{ background: #5a6578 !important; }}
-[data-testid="stFileUploader"] section {{ color: {TEXT_DIM} !important; }}
-[data-testid="stFileUploader"] small {{ color: {TEXT_MUTED} !important; }}
-
-.stSelectbox > div > div {{ background: {CARD} !important; border: 1px solid {BORDER} !important; border-radius: 8px !important; color: {TEXT} !important; }}
-.stSelectbox label {{ color: {TEXT_DIM} !important; }}
-.stNumberInput > div > div > input {{ background: {CARD} !important; border: 1px solid {BORDER} !important; border-radius: 8px !important; color: {TEXT} !important; }}
-.stNumberInput label {{ color: {TEXT_DIM} !important; }}
-.stRadio > label {{ color: {TEXT_DIM} !important; }}
-
-hr {{ border-color: {BORDER} !important; margin: 2rem 0 !important; }}
-
-.info-box {{ background: {CARD}; border-left: 3px solid {ACCENT}; border-radius: 0 8px 8px 0; padding: 1rem; color: {TEXT_DIM}; }}
-.info-box strong {{ color: {TEXT}; }}
-
-.warning-box {{ background: rgba(255, 170, 0, 0.08); border: 1px solid rgba(255, 170, 0, 0.3); border-radius: 8px; padding: 0.75rem 1rem; color: #FFAA00; font-size: 13px; margin-bottom: 1rem; }}
-
-.energy-bar {{ display: flex; width: 100%; border-radius: 6px; overflow: hidden; margin-top: 0.5rem; }}
-.energy-seg {{ flex: 1; text-align: center; padding: 12px 0; font-weight: 700; font-size: 1.1rem; transition: all 0.3s ease; }}
-.energy-seg.active {{ box-shadow: 0 0 20px rgba(0, 212, 255, 0.5); transform: scale(1.08); z-index: 10; }}
-.energy-arrow {{ text-align: center; font-size: 1.5rem; margin-bottom: -8px; color: {TEXT}; }}
-
-.footer {{ text-align: center; padding: 2rem 0 1rem 0; color: {TEXT_MUTED}; font-size: 13px; }}
-.footer a {{ color: {ACCENT}; text-decoration: none; }}
-</style>
-""", unsafe_allow_html=True)
+# The block must be re-emitted on every rerun (Streamlit drops elements a run
+# does not render), but the HTML itself is built once in theme.py.
+st.markdown(CSS_HTML, unsafe_allow_html=True)
 
 
 # ---------------------- Constants ----------------------
 GRID_FACTORS = {"Mexico (~0.42)": 0.42, "EU-27 (~0.25)": 0.25, "USA (~0.40)": 0.40, "Renewables (~0.10)": 0.10}
-LIFETIME_DEFAULTS = {"Cooking": 10, "Cooling": 12, "Washing": 10, "Drying": 12}
-PRODUCT_TYPES = ["Cooking", "Cooling", "Washing", "Drying"]
-KWH_DEFAULTS = {"Cooking": 95.0, "Cooling": 190.0, "Washing": 150.0, "Drying": 400.0}
 FRIENDLY_NAMES = {
     "Transport_kgCO2e": ("🚚", "Transport CO₂"),
     "Materials_kgCO2e": ("📦", "Materials CO₂"),
@@ -114,22 +53,62 @@ FRIENDLY_NAMES = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class ProductSpec:
+    """Per-category defaults, with the kWh presets precomputed once."""
+    kwh_default: float
+    lifetime: int
+    kwh_presets: Tuple[float, float, float]
+
+    @classmethod
+    def build(cls, kwh_default: float, lifetime: int) -> "ProductSpec":
+        return cls(kwh_default, lifetime, tuple(round(kwh_default * x, 0) for x in (0.85, 1.0, 1.15)))
+
+
+SPECS = {
+    "Cooking": ProductSpec.build(95.0, 10),
+    "Cooling": ProductSpec.build(190.0, 12),
+    "Washing": ProductSpec.build(150.0, 10),
+    "Drying": ProductSpec.build(400.0, 12),
+}
+DEFAULT_SPEC = ProductSpec.build(180, 10)
+PRODUCT_TYPES = list(SPECS)
+CO2_PRESETS = {
+    "Transport_kgCO2e": (2.0, 5.0, 10.0),
+    "Materials_kgCO2e": (50.0, 100.0, 150.0),
+    "Production_kgCO2e": (15.0, 25.0, 40.0),
+}
+
+
 # ---------------------- Helpers ----------------------
+@st.cache_data(show_spinner=False, max_entries=8)
+def sheet_names_cached(wb_bytes: bytes) -> List[str]:
+    """Sheet names per workbook content, reused across reruns."""
+    return list_sheet_names(wb_bytes)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def extract_cached(wb_bytes: bytes, sheet: str):
+    """
+    Extraction per (workbook content, sheet), reused across reruns.
+    
+    extraction_core caches the parsed sheet itself, so switching back and
+    forth between sheets of one upload parses each sheet's XML only once.
+    """
+    return extract_required_inputs(wb_bytes, sheet)
+
+
 def step_header(num: int, title: str):
     st.markdown(f'<div class="step-header"><div class="step-num">{num}</div><div class="step-title">{title}</div></div>', unsafe_allow_html=True)
 
 
-def get_presets(key: str, extracted: float, product_type: str) -> List[float]:
+def get_presets(key: str, extracted: float, product_type: str) -> Tuple[float, ...]:
     """Get preset values for a given key."""
     if extracted > 0:
-        return [round(extracted * 0.9, 1), round(extracted, 1), round(extracted * 1.1, 1)]
-    presets = {
-        "Transport_kgCO2e": [2.0, 5.0, 10.0],
-        "Materials_kgCO2e": [50.0, 100.0, 150.0],
-        "Production_kgCO2e": [15.0, 25.0, 40.0],
-        "Use_kWh_per_year": [round(KWH_DEFAULTS.get(product_type, 180) * x, 0) for x in [0.85, 1.0, 1.15]]
-    }
-    return presets.get(key, [0.0, 0.0, 0.0])
+        return (round(extracted * 0.9, 1), round(extracted, 1), round(extracted * 1.1, 1))
+    if key == "Use_kWh_per_year":
+        return SPECS.get(product_type, DEFAULT_SPEC).kwh_presets
+    return CO2_PRESETS.get(key, (0.0, 0.0, 0.0))
 
 
 def suggest_label(kwh: float, product_type: str = "Cooling") -> str:
@@ -153,11 +132,9 @@ def suggest_label(kwh: float, product_type: str = "Cooling") -> str:
 
 def to_csv(rows: List[List], delimiter: str = ",") -> bytes:
     """Convert rows to CSV bytes with BOM."""
-    def esc(cell):
-        s = str(cell)
-        return f'"{s}"' if any(c in s for c in ["\n", delimiter, '"']) else s
-    body = "\r\n".join([delimiter.join(esc(c) for c in row) for row in rows])
-    return b"\xef\xbb\xbf" + body.encode("utf-8")
+    buf = io.StringIO()
+    csv.writer(buf, delimiter=delimiter, quoting=csv.QUOTE_MINIMAL).writerows(rows)
+    return b"\xef\xbb\xbf" + buf.getvalue().encode("utf-8")
 
 
 # ---------------------- App ----------------------
@@ -173,29 +150,28 @@ with col1:
 with col2:
     st.markdown('<div class="info-box"><strong>What we extract:</strong><br>• Annual kWh consumption<br>• Product specifications</div>', unsafe_allow_html=True)
 
-dfs, wb_bytes = {}, None
+sheet_names, wb_bytes = [], None
 if file:
     with st.spinner("Analyzing..."):
-        wb_bytes = file.read()
-        file.seek(0)
-        dfs = load_workbook_sheets(wb_bytes)
-    st.success(f"✓ Found **{len(dfs)} sheets**")
+        wb_bytes = file.getvalue()
+        sheet_names = sheet_names_cached(wb_bytes)
+    st.success(f"✓ Found **{len(sheet_names)} sheets**")
 
 
 # STEP 2: Select Product
-if dfs and wb_bytes:
+if sheet_names and wb_bytes:
     st.divider()
     step_header(2, "Select Product")
     
     col1, col2 = st.columns(2)
     with col1:
-        product_type = st.selectbox("Category", PRODUCT_TYPES, index=3 if "Dryer" in str(list(dfs.keys())) else 1)
+        product_type = st.selectbox("Category", PRODUCT_TYPES, index=3 if "Dryer" in str(sheet_names) else 1)
         st.session_state.product_type = product_type
     with col2:
-        model_sheets = detect_model_sheets(list(dfs.keys()))
-        sheet = st.selectbox("Data Sheet", list(dfs.keys()), index=list(dfs.keys()).index(model_sheets[0]) if model_sheets and model_sheets[0] in dfs else 0)
+        model_sheets = detect_model_sheets(sheet_names)
+        sheet = st.selectbox("Data Sheet", sheet_names, index=sheet_names.index(model_sheets[0]) if model_sheets and model_sheets[0] in sheet_names else 0)
     
-    extraction = extract_required_inputs(wb_bytes, sheet)
+    extraction = extract_cached(wb_bytes, sheet)
     
     # STEP 3: Review Inputs
     st.divider()
@@ -241,7 +217,7 @@ if hasattr(st.session_state, "inputs"):
         grid_factor = st.number_input("Custom (kg/kWh)", value=grid_factor, min_value=0.05, max_value=1.0, step=0.01)
     with col3:
         ptype = getattr(st.session_state, "product_type", "Cooling")
-        lifetime = st.number_input("Lifetime (years)", value=LIFETIME_DEFAULTS.get(ptype, 10), min_value=1, max_value=30)
+        lifetime = st.number_input("Lifetime (years)", value=SPECS.get(ptype, DEFAULT_SPEC).lifetime, min_value=1, max_value=30)
     
     if st.button("Calculate CO₂ Footprint", use_container_width=True):
         with st.spinner("Calculating..."):
@@ -322,13 +298,13 @@ if hasattr(st.session_state, "results"):
     
     r = st.session_state.results
     rows = [
-        ["Mabe PaceSetter Results"], [""],
+        ["Mabe PaceSetter Results"], [],
         ["Product Type", st.session_state.product_type],
         ["Energy Label", st.session_state.energy_label],
         ["Annual kWh", f"{st.session_state.inputs.get('Use_kWh_per_year', 0):.1f}"],
         ["Lifetime (years)", str(st.session_state.lifetime)],
         ["Grid Factor", f"{st.session_state.grid_factor:.2f}"],
-        [""], ["Phase", "kg CO₂", "Share %"],
+        [], ["Phase", "kg CO₂", "Share %"],
         ["Transport", f"{r['Transport_kgCO2e']:.1f}", f"{r['Share_Transport_%']:.1f}"],
         ["Materials", f"{r['Materials_kgCO2e']:.1f}", f"{r['Share_Materials_%']:.1f}"],
         ["Production", f"{r['Production_kgCO2e']:.1f}", f"{r['Share_Production_%']:.1f}"],
@@ -7,12 +7,19 @@ Streamlit UI and future API endpoints. No Streamlit dependencies.
 
 from __future__ import annotations
 
+import hashlib
 import io
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Literal, Optional, Tuple
+from functools import lru_cache
+from typing import BinaryIO, Callable, Dict, List, Literal, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
+from openpyxl import load_workbook
 
 
 # ============================================================================
@@ -57,6 +64,10 @@ class ExtractionResult:
 # Constants
 # ============================================================================
 
+# Workbook content: raw bytes, or a seekable binary file such as an upload's
+# SpooledTemporaryFile (read in place, without copying it into memory)
+WorkbookSource = Union[bytes, BinaryIO]
+
 REQUIRED_KEYS = [
     "Transport_kgCO2e",
     "Materials_kgCO2e",
@@ -64,6 +75,26 @@ REQUIRED_KEYS = [
     "Use_kWh_per_year",
 ]
 
+# Position of the use-phase kWh in REQUIRED_KEYS-ordered arrays
+USE_KWH_IDX = REQUIRED_KEYS.index("Use_kWh_per_year")
+
+# Positions of the phases already given in kg CO2e
+CO2_PHASE_IDX = [i for i in range(len(REQUIRED_KEYS)) if i != USE_KWH_IDX]
+
+# KPI names as returned by compute_kpis, and the column order of compute_kpis_batch
+KPI_KEYS = [
+    "Transport_kgCO2e",
+    "Materials_kgCO2e",
+    "Production_kgCO2e",
+    "Use_kWh_per_year",
+    "UsePhase_CO2e",
+    "Total_CO2e",
+    "Share_Transport_%",
+    "Share_Materials_%",
+    "Share_Production_%",
+    "Share_Use_%",
+]
+
 # Anchor synonyms for label-based extraction (case-insensitive)
 # NOTE: CO2 keys require explicit CO2/emission context to avoid false positives
 ANCHOR_SYNONYMS: Dict[str, List[str]] = {
@@ -132,14 +163,84 @@ HEADER_SYNONYMS: Dict[str, List[str]] = {
     "Use_kWh_per_year": ["kwh/a", "kwh per year", "annual consumption", "use_kwh", "energy_use", "kwh/year"],
 }
 
+# Every header keyword, and one alternation matching a cell containing any
+_HEADER_KEYWORDS = tuple(k for v in HEADER_SYNONYMS.values() for k in v)
+_HEADER_PAT = re.compile("|".join(re.escape(k) for k in _HEADER_KEYWORDS))
+# Per key, one alternation matching a header containing any of its synonyms
+_KEY_PATS = {
+    key: re.compile("|".join(re.escape(s) for s in syns))
+    for key, syns in HEADER_SYNONYMS.items()
+}
+
+# Likely model/product sheet names, as one case-insensitive alternation
+MODEL_SHEET_RE = re.compile(
+    r"^(?:dryer|washer|cooler|refrigerator|fridge|cooling|cooking|washing)"
+    r"|\([A-Z0-9]{3,}\)"  # SKU in parentheses
+    r"|GTD|SMG|WTW|WMH|GFE|GSS",  # Common Mabe/GE model prefixes
+    re.IGNORECASE,
+)
+
 
 # ============================================================================
 # Parsing Helpers
 # ============================================================================
 
+# Stdlib re on purpose: cells are short, so per-call overhead dominates and
+# re2 bindings measured 10-30x slower here. re2's \s and \d are also
+# ASCII-only, which would stop NBSP-separated labels ("energy\xa0use") and
+# full-width digits from normalizing/parsing as they do now.
+_WS_RE = re.compile(r"\s+")
+# Unit suffix or any single char outside [0-9.,-], stripped in one pass.
+# Commas survive so the decimal/thousands heuristic can still see them.
+_STRIP_RE = re.compile(
+    r"\s*(kwh|kgco2e?|kg\s*co2|%|per\s*year|/year|/a|/año)\s*$|[^\d.,\-]",
+    re.IGNORECASE,
+)
+_DIGIT_RE = re.compile(r"\d")
+# Exactly the strings over [0-9.-] that float() accepts
+_NUMBER_RE = re.compile(r"-?(?:\d+\.?\d*|\.\d+)")
+
+
 def normalize(s: str) -> str:
     """Normalize string for comparison."""
-    return re.sub(r"\s+", " ", str(s).strip().lower())
+    return _normalize_cached(str(s))
+
+
+@lru_cache(maxsize=16384)
+def _normalize_cached(s: str) -> str:
+    """normalize() for an actual str; synonyms and labels repeat constantly."""
+    # Already normalized (the usual synonym/header spelling): isprintable()
+    # rules out every whitespace char except " ", so no regex work is needed
+    if s.isprintable() and s == s.lower() and s[:1] != " " and s[-1:] != " " and "  " not in s:
+        return s
+    return _WS_RE.sub(" ", s.strip().lower())
+
+
+def normalize_cells(df: pd.DataFrame) -> np.ndarray:
+    """
+    normalize() applied to every cell, as a 2-D object array of strings.
+    
+    Empty cells become "" rather than "nan"/"None"; no synonym matches either,
+    so the scans behave the same and skip stringifying them.
+    """
+    raw = df.to_numpy(dtype=object)
+    flat = pd.Series(np.where(pd.isna(raw), "", raw).ravel(), dtype=object)
+    flat = flat.astype(str).str.strip().str.lower().str.replace(_WS_RE, " ", regex=True)
+    return flat.to_numpy().reshape(raw.shape)
+
+
+def _cells_matching(cells: np.ndarray, pattern: "re.Pattern[str]") -> np.ndarray:
+    """
+    Indices of the normalized cells (1-D) in which pattern finds a match.
+    
+    Normalized cells never contain "\n", so the cells are joined with it and
+    the whole sheet is searched in one finditer() call; each match start is
+    mapped back to its cell by binary search over the cell offsets.
+    """
+    lengths = np.fromiter(map(len, cells), np.int64, len(cells)) + 1
+    starts = np.cumsum(lengths) - lengths
+    matches = np.fromiter((m.start() for m in pattern.finditer("\n".join(cells.tolist()))), np.int64)
+    return np.unique(np.searchsorted(starts, matches, side="right") - 1)
 
 
 def parse_numeric_with_unit(value) -> Tuple[Optional[float], str]:
@@ -152,15 +253,26 @@ def parse_numeric_with_unit(value) -> Tuple[Optional[float], str]:
     if value is None:
         return None, ""
     
+    # Typed reads yield bools for TRUE/FALSE cells; like their old "True"
+    # text they carry no number (bool would pass the int check below)
+    if isinstance(value, bool):
+        return None, str(value)
+    
     if isinstance(value, (int, float)):
         return float(value), str(value)
     
     s = str(value).strip()
-    if not s or s.lower() in ("nan", "none", ""):
+    # Common case first: plain "123", "-4.5" need no regex work
+    digits = s[1:] if s.startswith("-") else s
+    if digits.replace(".", "", 1).isdecimal():
+        return float(s), s
+    # No digit anywhere (empty, "nan", prose labels) can never parse; one C
+    # search is cheaper than the strip/validate pipeline below
+    if not _DIGIT_RE.search(s):
         return None, s
     
-    # Remove common unit suffixes
-    cleaned = re.sub(r"\s*(kwh|kgco2e?|kg\s*co2|%|per\s*year|/year|/a|/año)\s*$", "", s, flags=re.IGNORECASE)
+    # Remove unit suffixes and anything non-numeric except , . and -
+    cleaned = _STRIP_RE.sub("", s)
     
     # Handle comma as decimal separator (European format)
     # Rule: "1,200" (3 digits after comma) = thousand separator = 1200
@@ -177,23 +289,35 @@ def parse_numeric_with_unit(value) -> Tuple[Optional[float], str]:
         else:
             # Multiple commas or non-digit - remove all commas
             cleaned = cleaned.replace(",", "")
+    else:
+        cleaned = cleaned.replace(",", "")
     
-    # Remove any remaining non-numeric characters except . and -
-    cleaned = re.sub(r"[^\d.\-]", "", cleaned)
-    
-    try:
-        return float(cleaned), s
-    except (ValueError, TypeError):
+    # Validate with one match instead of letting float() raise on leftovers
+    # like "", "-" or "1.2.3" (the common case for text cells)
+    if not _NUMBER_RE.fullmatch(cleaned):
         return None, s
+    return float(cleaned), s
+
+
+def _col_letter_slow(col_idx: int) -> str:
+    """Bytearray fallback for col_index_to_letter past _COL_LETTERS; also builds that table."""
+    buf = bytearray()
+    while col_idx >= 0:
+        col_idx, rem = divmod(col_idx, 26)
+        buf.append(65 + rem)  # ord("A")
+        col_idx -= 1
+    return buf[::-1].decode("ascii")
+
+
+# Letters for columns A..AMJ, which covers practically every real sheet
+_COL_LETTERS = tuple(_col_letter_slow(i) for i in range(1024))
 
 
 def col_index_to_letter(col_idx: int) -> str:
     """Convert 0-based column index to Excel column letter (A, B, ..., Z, AA, AB, ...)."""
-    result = ""
-    while col_idx >= 0:
-        result = chr(col_idx % 26 + ord('A')) + result
-        col_idx = col_idx // 26 - 1
-    return result
+    if 0 <= col_idx < len(_COL_LETTERS):
+        return _COL_LETTERS[col_idx]
+    return _col_letter_slow(col_idx)
 
 
 # ============================================================================
@@ -204,6 +328,7 @@ def find_anchor_value(
     df: pd.DataFrame,
     anchors: List[str],
     sheet_name: str,
+    norm_cells: Optional[np.ndarray] = None,
 ) -> Tuple[Optional[float], Optional[Provenance]]:
     """
     Search for anchor text and extract the nearest numeric value.
@@ -213,60 +338,138 @@ def find_anchor_value(
     2. Look for numeric value in same row (prefer rightward cells)
     3. If not found, look in cell directly below
     
+    `norm_cells` is ``normalize_cells(df)``; pass it in when scanning the same
+    sheet repeatedly so the normalization is done only once.
+    
     Returns:
         Tuple of (value, provenance) or (None, None) if not found
     """
-    df_str = df.astype(str).fillna("")
+    if not anchors or df.empty:
+        return None, None
     
-    for anchor in anchors:
-        anchor_norm = normalize(anchor)
-        
-        # Search all cells for anchor match
-        for row_idx in range(len(df)):
-            for col_idx in range(df.shape[1]):
-                cell_val = normalize(df_str.iloc[row_idx, col_idx])
-                
-                if anchor_norm in cell_val:
-                    # Found anchor! Now look for numeric value
-                    
-                    # Strategy 1: Look rightward in same row
-                    for search_col in range(col_idx + 1, df.shape[1]):
-                        val, orig = parse_numeric_with_unit(df.iloc[row_idx, search_col])
-                        if val is not None and val > 0:
-                            cell_ref = f"{col_index_to_letter(search_col)}{row_idx + 1}"
-                            return val, Provenance(
-                                method="anchor",
-                                sheet=sheet_name,
-                                cell_ref=cell_ref,
-                                anchor_text=df_str.iloc[row_idx, col_idx][:50],
-                                confidence=0.9,
-                            )
-                    
-                    # Strategy 2: Look in same column, next row
-                    if row_idx + 1 < len(df):
-                        val, orig = parse_numeric_with_unit(df.iloc[row_idx + 1, col_idx])
-                        if val is not None and val > 0:
-                            cell_ref = f"{col_index_to_letter(col_idx)}{row_idx + 2}"
-                            return val, Provenance(
-                                method="anchor",
-                                sheet=sheet_name,
-                                cell_ref=cell_ref,
-                                anchor_text=df_str.iloc[row_idx, col_idx][:50],
-                                confidence=0.8,
-                            )
-                    
-                    # Strategy 3: Look leftward (value before label)
-                    for search_col in range(col_idx - 1, -1, -1):
-                        val, orig = parse_numeric_with_unit(df.iloc[row_idx, search_col])
-                        if val is not None and val > 0:
-                            cell_ref = f"{col_index_to_letter(search_col)}{row_idx + 1}"
-                            return val, Provenance(
-                                method="anchor",
-                                sheet=sheet_name,
-                                cell_ref=cell_ref,
-                                anchor_text=df_str.iloc[row_idx, col_idx][:50],
-                                confidence=0.7,
-                            )
+    if norm_cells is None:
+        norm_cells = normalize_cells(df)
+    
+    # Find cells containing any anchor (one alternation regex) in a single
+    # sheet-wide search; only the few hits reach the Python loop
+    anchors_norm, pattern = _anchor_pattern(tuple(anchors))
+    flat = norm_cells.ravel()
+    candidates = _cells_matching(flat, pattern)
+    ncols = norm_cells.shape[1]
+    
+    # One pass over the candidates records, per anchor, the cells containing
+    # it (row-major); anchors are then resolved in list order so an earlier
+    # anchor still wins over an earlier cell
+    hits: List[List[Tuple[int, int]]] = [[] for _ in anchors_norm]
+    for flat_idx in candidates.tolist():
+        cell_val = flat[flat_idx]
+        for i, anchor_norm in enumerate(anchors_norm):
+            if anchor_norm in cell_val:
+                hits[i].append(divmod(flat_idx, ncols))
+    
+    columns = _column_arrays(df)
+    parsed: Dict[Tuple[int, int], Optional[float]] = {}
+    for row_idx, col_idx in (pos for anchor_hits in hits for pos in anchor_hits):
+        # Found anchor! Now look for numeric value
+        value, prov = _value_near_anchor(columns, row_idx, col_idx, sheet_name, parsed)
+        if value is not None:
+            return value, prov
+    
+    return None, None
+
+
+@lru_cache(maxsize=64)
+def _anchor_pattern(anchors: Tuple[str, ...]) -> Tuple[Tuple[str, ...], "re.Pattern[str]"]:
+    """
+    Normalized anchors plus one alternation matching a cell containing any.
+    
+    Cached because every extraction asks again for the same ANCHOR_SYNONYMS
+    lists. The alternation only preselects cells: one match names just one
+    anchor, while priority needs every anchor a cell contains ("annual
+    energy consumption" also contains "energy consumption"), so callers
+    still test the candidates anchor by anchor.
+    """
+    anchors_norm = tuple(normalize(a) for a in anchors)
+    return anchors_norm, re.compile("|".join(re.escape(a) for a in anchors_norm))
+
+
+def _column_arrays(df: pd.DataFrame) -> List[np.ndarray]:
+    """
+    Each column of df as its own ndarray, for cheap scalar access in scans.
+    
+    Per column rather than one 2-D df.to_numpy(), which would box mixed
+    dtypes into Python objects instead of yielding what df.iloc yields.
+    """
+    return [df.iloc[:, i].to_numpy() for i in range(df.shape[1])]
+
+
+def _parsed_cell(
+    columns: List[np.ndarray],
+    row_idx: int,
+    col_idx: int,
+    parsed: Dict[Tuple[int, int], Optional[float]],
+) -> Optional[float]:
+    """Numeric value of a cell (None if not numeric), parsed at most once per scan."""
+    pos = (row_idx, col_idx)
+    if pos not in parsed:
+        parsed[pos] = parse_numeric_with_unit(columns[col_idx][row_idx])[0]
+    return parsed[pos]
+
+
+def _value_near_anchor(
+    columns: List[np.ndarray],
+    row_idx: int,
+    col_idx: int,
+    sheet_name: str,
+    parsed: Dict[Tuple[int, int], Optional[float]],
+) -> Tuple[Optional[float], Optional[Provenance]]:
+    """
+    Find the numeric value belonging to the anchor label at (row_idx, col_idx).
+    
+    Neighbor cells are often visited again for another anchor in the same
+    cell or another key on the same row, so parsed values are memoized in
+    `parsed`, which the caller shares across one sheet scan.
+    """
+    anchor_text = str(columns[col_idx][row_idx])[:50]
+    
+    # Strategy 1: Look rightward in same row
+    for search_col in range(col_idx + 1, len(columns)):
+        val = _parsed_cell(columns, row_idx, search_col, parsed)
+        if val is not None and val > 0:
+            cell_ref = f"{col_index_to_letter(search_col)}{row_idx + 1}"
+            return val, Provenance(
+                method="anchor",
+                sheet=sheet_name,
+                cell_ref=cell_ref,
+                anchor_text=anchor_text,
+                confidence=0.9,
+            )
+    
+    # Strategy 2: Look in same column, next row
+    if row_idx + 1 < len(columns[col_idx]):
+        val = _parsed_cell(columns, row_idx + 1, col_idx, parsed)
+        if val is not None and val > 0:
+            cell_ref = f"{col_index_to_letter(col_idx)}{row_idx + 2}"
+            return val, Provenance(
+                method="anchor",
+                sheet=sheet_name,
+                cell_ref=cell_ref,
+                anchor_text=anchor_text,
+                confidence=0.8,
+            )
+    
+    # Strategy 3: Look leftward (value before label)
+    for search_col in range(col_idx - 1, -1, -1):
+        val = _parsed_cell(columns, row_idx, search_col, parsed)
+        if val is not None and val > 0:
+            cell_ref = f"{col_index_to_letter(search_col)}{row_idx + 1}"
+            return val, Provenance(
+                method="anchor",
+                sheet=sheet_name,
+                cell_ref=cell_ref,
+                anchor_text=anchor_text,
+                confidence=0.7,
+            )
     
     return None, None
 
@@ -275,37 +478,43 @@ def find_anchor_value(
 # Table-Based Extraction
 # ============================================================================
 
-def detect_header_row(df: pd.DataFrame, max_check: int = 15) -> int:
+def detect_header_row(
+    df: pd.DataFrame,
+    max_check: int = 15,
+    norm_cells: Optional[np.ndarray] = None,
+) -> int:
     """Detect the most likely header row using keyword hits."""
-    keys = [k for v in HEADER_SYNONYMS.values() for k in v]
-    best_row, best_hits = 0, -1
-    
-    for i in range(min(max_check, len(df))):
-        hits = 0
-        row_vals = df.iloc[i].astype(str).fillna("").tolist()
-        row_norm = [normalize(x) for x in row_vals]
-        for cell in row_norm:
-            for k in keys:
-                if k in cell:
-                    hits += 1
-        if hits > best_hits:
-            best_hits, best_row = hits, i
-    
-    return best_row
+    if norm_cells is None:
+        norm_cells = normalize_cells(df.iloc[:max_check])
+    block = norm_cells[:min(max_check, len(df))]
+    if not block.size:
+        return 0
+    
+    # A row scores one hit per keyword contained in each of its cells. The
+    # alternation finds the (few) cells containing any keyword in one
+    # search; only those are counted keyword by keyword.
+    cells = block.ravel()
+    matched = _cells_matching(cells, _HEADER_PAT)
+    hits = np.zeros(block.shape[0], dtype=np.int64)
+    for flat_idx in matched:
+        cell = cells[flat_idx]
+        hits[flat_idx // block.shape[1]] += sum(k in cell for k in _HEADER_KEYWORDS)
+    
+    # argmax keeps the first row on ties, and row 0 when nothing matches
+    return int(hits.argmax())
 
 
 def map_headers(headers: List[str]) -> Dict[str, Optional[int]]:
     """Map header names to column indices using synonyms."""
     mapped: Dict[str, Optional[int]] = {k: None for k in REQUIRED_KEYS}
-    nheaders = [normalize(h) for h in headers]
+    # Blank headers never map; their normalized "" matches no synonym
+    nheaders = np.array([normalize(h) if h else "" for h in headers], dtype=object)
     
-    for key, syns in HEADER_SYNONYMS.items():
-        for i, h in enumerate(nheaders):
-            if not headers[i]:
-                continue
-            if any(s in h for s in syns):
-                mapped[key] = i
-                break
+    # One whole-row search per key; the first matching column wins
+    for key, pattern in _KEY_PATS.items():
+        matches = _cells_matching(nheaders, pattern)
+        if matches.size:
+            mapped[key] = int(matches[0])
     
     return mapped
 
@@ -324,23 +533,44 @@ def extract_table_value(
     if col_idx is None or col_idx < 0 or col_idx >= df.shape[1]:
         return None, None
     
-    # Find first non-null numeric value in the column
-    col_letter = col_index_to_letter(col_idx)
+    # Find first positive numeric value in the column
+    found = _first_positive(df.iloc[:, col_idx].to_numpy())
+    if found is None:
+        return None, None
     
-    for row_idx in range(len(df)):
-        cell_val = df.iloc[row_idx, col_idx]
+    row_idx, parsed = found
+    cell_ref = f"{col_index_to_letter(col_idx)}{row_idx + 2}"  # +2 because header row + 1-indexed
+    return parsed, Provenance(
+        method="table",
+        sheet=sheet_name,
+        cell_ref=cell_ref,
+        anchor_text=None,
+        confidence=0.6,
+    )
+
+
+def _first_positive(values: np.ndarray) -> Optional[Tuple[int, float]]:
+    """
+    (index, value) of the first element that parses to a number > 0.
+    
+    A column holding only numbers (an object column below a text header
+    usually does) is searched with one vectorized comparison. Columns with
+    text keep the per-cell parse: it stops at the first hit, usually the
+    first data row, which pandas string ops can't beat.
+    """
+    if values.dtype == object:
+        inferred = pd.Series(values).infer_objects().to_numpy()
+        if inferred.dtype.kind in "iuf":
+            values = inferred
+    if values.dtype.kind in "iuf":
+        positive = np.flatnonzero(values > 0)
+        return (int(positive[0]), float(values[positive[0]])) if positive.size else None
+    
+    for row_idx, cell_val in enumerate(values):
         parsed, _ = parse_numeric_with_unit(cell_val)
         if parsed is not None and parsed > 0:
-            cell_ref = f"{col_letter}{row_idx + 2}"  # +2 because header row + 1-indexed
-            return parsed, Provenance(
-                method="table",
-                sheet=sheet_name,
-                cell_ref=cell_ref,
-                anchor_text=None,
-                confidence=0.6,
-            )
-    
-    return None, None
+            return row_idx, parsed
+    return None
 
 
 # ============================================================================
@@ -348,8 +578,9 @@ def extract_table_value(
 # ============================================================================
 
 def extract_required_inputs(
-    workbook_bytes: bytes,
+    workbook: Union[WorkbookSource, pd.DataFrame],
     model_sheet: str,
+    digest: Optional[bytes] = None,
 ) -> ExtractionResult:
     """
     Extract all required inputs from a workbook using the specified model sheet.
@@ -359,28 +590,56 @@ def extract_required_inputs(
     2. Table-based (header row + column sum)
     
     Args:
-        workbook_bytes: Excel file content as bytes
+        workbook: Excel file content as bytes or a binary file object, or the
+            model sheet already loaded via load_single_sheet / load_workbook_sheets
         model_sheet: Name of the sheet to extract from
+        digest: content_digest(workbook), if the caller already has it, so the
+            content is not hashed again; ignored for a DataFrame
         
     Returns:
         ExtractionResult with inputs, provenance, and warnings
     """
+    if isinstance(workbook, pd.DataFrame):
+        return _extract_from_frame(workbook, model_sheet)
+    if digest is None:
+        digest = content_digest(workbook)
+    return _extract_sheet(workbook, digest, model_sheet)
+
+
+def _extract_sheet(source: WorkbookSource, digest: bytes, model_sheet: str) -> ExtractionResult:
+    """extract_required_inputs for a sheet of workbook content whose digest is already known."""
+    # Read only the target sheet, and only once per workbook content;
+    # the other sheets' XML is never parsed
+    try:
+        df = _parse_sheet(source, digest, model_sheet)
+    except _SheetNotFound as e:
+        warning = f"Sheet '{model_sheet}' not found. Available: {e.available}"
+    except Exception as e:
+        warning = f"Failed to read workbook: {e}"
+    else:
+        return _extract_from_frame(df, model_sheet)
+    return ExtractionResult(inputs={k: 0.0 for k in REQUIRED_KEYS}, provenance={}, warnings=[warning])
+
+
+def _extract_from_frame(df: pd.DataFrame, model_sheet: str) -> ExtractionResult:
+    """extract_required_inputs for a sheet that is already loaded."""
     inputs: Dict[str, float] = {}
     provenance: Dict[str, Provenance] = {}
     warnings: List[str] = []
     
-    try:
-        xls = pd.ExcelFile(io.BytesIO(workbook_bytes))
-    except Exception as e:
-        warnings.append(f"Failed to read workbook: {e}")
-        return ExtractionResult(inputs={k: 0.0 for k in REQUIRED_KEYS}, provenance={}, warnings=warnings)
-    
-    if model_sheet not in xls.sheet_names:
-        warnings.append(f"Sheet '{model_sheet}' not found. Available: {xls.sheet_names}")
-        return ExtractionResult(inputs={k: 0.0 for k in REQUIRED_KEYS}, provenance={}, warnings=warnings)
+    # Formatting often stretches a sheet's used range far past its data
+    df = _trim_empty_margins(df)
     
-    # Read the target sheet
-    df = xls.parse(model_sheet, header=None, dtype=str)
+    # Normalize the sheet and locate the table header once for all keys
+    norm_cells = normalize_cells(df) if not df.empty else None
+    mapping: Dict[str, Optional[int]] = {}
+    if not df.empty:
+        header_row = detect_header_row(df, norm_cells=norm_cells)
+        headers = [
+            str(h).strip() if str(h).strip().lower() not in ("nan", "none") else ""
+            for h in df.iloc[header_row].tolist()
+        ]
+        mapping = map_headers(headers)
     
     for key in REQUIRED_KEYS:
         value: Optional[float] = None
@@ -389,21 +648,13 @@ def extract_required_inputs(
         # Priority 1: Anchor-based extraction
         anchors = ANCHOR_SYNONYMS.get(key, [])
         if anchors:
-            value, prov = find_anchor_value(df, anchors, model_sheet)
+            value, prov = find_anchor_value(df, anchors, model_sheet, norm_cells)
         
         # Priority 2: Table-based extraction (fallback)
-        if value is None:
-            header_row = detect_header_row(df)
-            headers = [
-                str(h).strip() if str(h).strip().lower() not in ("nan", "none") else ""
-                for h in df.iloc[header_row].tolist()
-            ]
-            mapping = map_headers(headers)
-            col_idx = mapping.get(key)
-            
-            if col_idx is not None:
-                body = df.iloc[header_row + 1:].reset_index(drop=True)
-                value, prov = extract_table_value(body, col_idx, model_sheet, key)
+        col_idx = mapping.get(key)
+        if value is None and col_idx is not None:
+            body = df.iloc[header_row + 1:].reset_index(drop=True)
+            value, prov = extract_table_value(body, col_idx, model_sheet, key)
         
         # Record result
         if value is not None and prov is not None:
@@ -423,10 +674,210 @@ def extract_required_inputs(
     return ExtractionResult(inputs=inputs, provenance=provenance, warnings=warnings)
 
 
-def load_workbook_sheets(workbook_bytes: bytes) -> Dict[str, pd.DataFrame]:
-    """Load all sheets from a workbook as DataFrames."""
-    xls = pd.ExcelFile(io.BytesIO(workbook_bytes))
-    return {sheet: xls.parse(sheet, header=None, dtype=str) for sheet in xls.sheet_names}
+def extract_all_models(
+    workbook: WorkbookSource,
+    sheets: List[str],
+    max_workers: int = 8,
+) -> Dict[str, ExtractionResult]:
+    """
+    extract_required_inputs for several sheets of one workbook, in parallel.
+    
+    Each worker opens its own read-only view of the content, so no openpyxl
+    object is shared between threads. A file object is read into memory once
+    up front, since concurrent seek/read on it would interleave, and is left
+    rewound as the other loaders leave it.
+    
+    Returns:
+        Results keyed by sheet name, in the order of `sheets`
+    """
+    if not sheets:
+        return {}
+    if not isinstance(workbook, (bytes, bytearray)):
+        workbook.seek(0)
+        content = workbook.read()
+        workbook.seek(0)
+        workbook = content
+    digest = content_digest(workbook)
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(sheets))) as pool:
+        results = pool.map(lambda sheet: _extract_sheet(workbook, digest, sheet), sheets)
+        return dict(zip(sheets, results))
+
+
+def _trim_empty_margins(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Drop trailing all-empty rows and columns.
+    
+    Only the bottom/right margins go: leading blank rows and columns keep
+    their positions so cell references and the "cell below" rule still hold.
+    """
+    filled = df.notna().to_numpy()
+    rows, cols = np.flatnonzero(filled.any(axis=1)), np.flatnonzero(filled.any(axis=0))
+    if not rows.size:
+        return df.iloc[:0, :0]
+    if rows[-1] + 1 == df.shape[0] and cols[-1] + 1 == df.shape[1]:
+        return df
+    return df.iloc[:rows[-1] + 1, :cols[-1] + 1]
+
+
+def _open_workbook(source: WorkbookSource):
+    """
+    Open a workbook read-only (streaming XML, no styles or Cell objects) and
+    with cached formula results instead of formulas. Callers must close() it.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    else:
+        source.seek(0)
+    return load_workbook(source, read_only=True, data_only=True, keep_links=False)
+
+
+def _sheet_to_frame(ws) -> pd.DataFrame:
+    """
+    Materialize a worksheet's raw cell values as a DataFrame.
+    
+    The declared dimension (<dimension ref="A1:Z1048576"/>) is ignored: it is
+    often stretched far past the data, and openpyxl would pad every row and
+    emit every row up to it. Only the rows and cells present in the sheet XML
+    are streamed, then padded to a rectangle with None as before.
+    """
+    ws.reset_dimensions()
+    rows = list(ws.iter_rows(values_only=True))
+    width = max(map(len, rows), default=0)
+    return pd.DataFrame([tuple(row) + (None,) * (width - len(row)) for row in rows])
+
+
+_HASH_CHUNK_SIZE = 64 * 1024
+_SHEET_CACHE_SIZE = 32
+
+
+def content_digest(source: WorkbookSource) -> bytes:
+    """
+    BLAKE2b digest of workbook content, the key of every parse cache.
+    
+    A file object is hashed in chunks rather than read into memory, and is
+    left rewound.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(source, (bytes, bytearray)):
+        h.update(source)
+    else:
+        source.seek(0)
+        while chunk := source.read(_HASH_CHUNK_SIZE):
+            h.update(chunk)
+        source.seek(0)
+    return h.digest()
+
+
+class _SheetNotFound(KeyError):
+    """KeyError for a missing sheet that also carries the workbook's sheet names."""
+    
+    def __init__(self, sheet: str, available: List[str]):
+        super().__init__(f"Worksheet {sheet} does not exist.")
+        self.available = available
+
+
+# (content digest, sheet name): the source itself is never part of a key,
+# so the cache does not keep workbook bytes or closed uploads alive
+_SheetKey = Tuple[bytes, str]
+
+# Parsed frames, least recently used first. An explicit LRU rather than
+# lru_cache so that one workbook open can fill in all of its sheets.
+_sheet_cache: "OrderedDict[_SheetKey, pd.DataFrame]" = OrderedDict()
+_sheet_cache_lock = threading.Lock()
+
+
+def _cached_sheet(key: _SheetKey) -> Optional[pd.DataFrame]:
+    with _sheet_cache_lock:
+        frame = _sheet_cache.get(key)
+        if frame is not None:
+            _sheet_cache.move_to_end(key)
+        return frame
+
+
+def _cache_sheet(key: _SheetKey, frame: pd.DataFrame) -> None:
+    with _sheet_cache_lock:
+        _sheet_cache[key] = frame
+        _sheet_cache.move_to_end(key)
+        while len(_sheet_cache) > _SHEET_CACHE_SIZE:
+            _sheet_cache.popitem(last=False)
+
+
+def _parse_sheet(source: WorkbookSource, digest: bytes, sheet: str) -> pd.DataFrame:
+    """
+    One sheet's frame, parsed at most once per (workbook content, sheet).
+    
+    source is only read on a miss; digest must be its content_digest. The
+    frame is shared between callers and must not be mutated. Raises
+    _SheetNotFound when the workbook has no such sheet.
+    """
+    frame = _cached_sheet((digest, sheet))
+    if frame is not None:
+        return frame
+    wb = _open_workbook(source)
+    try:
+        if sheet not in wb.sheetnames:
+            raise _SheetNotFound(sheet, wb.sheetnames)
+        frame = _sheet_to_frame(wb[sheet])
+    finally:
+        wb.close()
+    _cache_sheet((digest, sheet), frame)
+    return frame
+
+
+def list_sheet_names(source: WorkbookSource) -> List[str]:
+    """List worksheet names without reading any cells (only the workbook part is parsed)."""
+    wb = _open_workbook(source)
+    try:
+        return [ws.title for ws in wb.worksheets]
+    finally:
+        wb.close()
+
+
+def load_workbook_sheets(
+    source: WorkbookSource,
+    name_filter: Optional[Callable[[str], bool]] = None,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Load worksheets from a workbook as DataFrames. Chartsheets carry no cells and are skipped.
+    
+    The content is hashed and opened once; every sheet parsed along the way
+    is cached (see _parse_sheet), and each call returns its own copies.
+    
+    Args:
+        source: Excel file content as bytes or a binary file object
+        name_filter: Optional predicate on the sheet name, checked before any
+            cells are read; sheets it rejects are never unzipped or parsed
+    """
+    digest = content_digest(source)
+    frames: Dict[str, pd.DataFrame] = {}
+    wb = _open_workbook(source)
+    try:
+        for ws in wb.worksheets:
+            if name_filter is not None and not name_filter(ws.title):
+                continue
+            key = (digest, ws.title)
+            frame = _cached_sheet(key)
+            if frame is None:
+                frame = _sheet_to_frame(ws)
+                _cache_sheet(key, frame)
+            frames[ws.title] = frame.copy()
+    finally:
+        wb.close()
+    return frames
+
+
+def load_single_sheet(source: WorkbookSource, sheet_name: str) -> pd.DataFrame:
+    """
+    Load one worksheet as a DataFrame without parsing any other sheet.
+    
+    The parse is cached per workbook content (see _parse_sheet); each call
+    returns its own copy.
+    
+    Raises:
+        KeyError: if the workbook has no sheet with that name
+    """
+    return _parse_sheet(source, content_digest(source), sheet_name).copy()
 
 
 def detect_model_sheets(sheet_names: List[str]) -> List[str]:
@@ -438,20 +889,7 @@ def detect_model_sheets(sheet_names: List[str]) -> List[str]:
     - Sheets with SKU patterns in parentheses
     - Product category prefixes (Washer, Cooler, Refrigerator, etc.)
     """
-    patterns = [
-        r"^(dryer|washer|cooler|refrigerator|fridge|cooling|cooking|washing)",
-        r"\([A-Z0-9]{3,}\)",  # SKU in parentheses
-        r"(GTD|SMG|WTW|WMH|GFE|GSS)",  # Common Mabe/GE model prefixes
-    ]
-    
-    model_sheets = []
-    for name in sheet_names:
-        name_lower = name.lower()
-        for pattern in patterns:
-            if re.search(pattern, name_lower, re.IGNORECASE):
-                model_sheets.append(name)
-                break
-    
+    model_sheets = [name for name in sheet_names if MODEL_SHEET_RE.search(name)]
     return model_sheets if model_sheets else sheet_names[:1]  # Fallback to first sheet
 
 
@@ -475,31 +913,80 @@ def compute_kpis(
     Returns:
         Dict with phase values, totals, and shares
     """
-    t = float(inputs.get("Transport_kgCO2e", 0) or 0)
-    m = float(inputs.get("Materials_kgCO2e", 0) or 0)
-    p = float(inputs.get("Production_kgCO2e", 0) or 0)
-    kwh = float(inputs.get("Use_kWh_per_year", 0) or 0)
-    
-    use = kwh * grid_factor * lifetime
-    total = t + m + p + use
-    
-    if total > 0:
-        share_t = t / total * 100.0
-        share_m = m / total * 100.0
-        share_p = p / total * 100.0
-        share_use = use / total * 100.0
-    else:
-        share_t = share_m = share_p = share_use = 0.0
+    phases = tuple(inputs.get(k, 0) for k in REQUIRED_KEYS)
+    return dict(_compute_kpis_cached(phases, grid_factor, lifetime))
+
+
+@lru_cache(maxsize=256)
+def _compute_kpis_cached(
+    phases: Tuple[float, ...],
+    grid_factor: float,
+    lifetime: int,
+) -> Dict[str, float]:
+    """
+    compute_kpis on REQUIRED_KEYS-ordered values; memoized because Streamlit reruns repeat it.
     
+    Plain float arithmetic: for one row, building arrays costs more than the
+    math. compute_kpis_batch is the array version and gives the same values.
+    """
+    co2 = [float(v or 0) for v in phases]
+    kwh = co2[USE_KWH_IDX]
+    co2[USE_KWH_IDX] = kwh * grid_factor * lifetime
+    # Summed in REQUIRED_KEYS order; sum() would use compensated summation
+    total = co2[0]
+    for v in co2[1:]:
+        total += v
+    shares = [v / total * 100.0 if total > 0 else 0.0 for v in co2]
+    
+    values = [co2[i] for i in CO2_PHASE_IDX] + [kwh, co2[USE_KWH_IDX], total] + shares
+    # Python round() (correctly rounded), not np.round, to keep the exact outputs
     return {
-        "Transport_kgCO2e": round(t, 2),
-        "Materials_kgCO2e": round(m, 2),
-        "Production_kgCO2e": round(p, 2),
-        "Use_kWh_per_year": round(kwh, 2),
-        "UsePhase_CO2e": round(use, 2),
-        "Total_CO2e": round(total, 2),
-        "Share_Transport_%": round(share_t, 1),
-        "Share_Materials_%": round(share_m, 1),
-        "Share_Production_%": round(share_p, 1),
-        "Share_Use_%": round(share_use, 1),
+        key: round(v, 1 if key.startswith("Share_") else 2)
+        for key, v in zip(KPI_KEYS, values)
     }
+
+
+def compute_kpis_batch(
+    inputs: np.ndarray,
+    grid_factor: float,
+    lifetime: int,
+) -> np.ndarray:
+    """
+    compute_kpis for many input rows at once.
+    
+    Args:
+        inputs: (N, 4) float array, columns in REQUIRED_KEYS order (see inputs_to_array)
+        grid_factor: kg CO2e per kWh
+        lifetime: Product lifetime in years
+        
+    Returns:
+        (N, 10) float64 array, columns in KPI_KEYS order; values are unrounded
+    
+    Raises:
+        ValueError: if inputs is not (N, 4), or a single row of 4
+    """
+    inputs = np.asarray(inputs, dtype=np.float64)
+    if inputs.ndim == 1:
+        inputs = np.atleast_2d(inputs)
+    if inputs.ndim != 2 or inputs.shape[1] != len(REQUIRED_KEYS):
+        raise ValueError(f"inputs must have shape (N, {len(REQUIRED_KEYS)}), got {inputs.shape}")
+    
+    # Per-phase CO2e: the kWh column becomes use-phase CO2e
+    co2 = inputs.copy()
+    co2[:, USE_KWH_IDX] = co2[:, USE_KWH_IDX] * grid_factor * lifetime
+    # Summed column by column in REQUIRED_KEYS order, like the scalar total
+    total = co2[:, 0].copy()
+    for i in range(1, len(REQUIRED_KEYS)):
+        total += co2[:, i]
+    shares = np.zeros_like(co2)
+    np.divide(co2, total[:, None], out=shares, where=total[:, None] > 0)
+    shares *= 100.0
+    
+    return np.column_stack([
+        co2[:, CO2_PHASE_IDX], inputs[:, USE_KWH_IDX], co2[:, USE_KWH_IDX], total, shares,
+    ])
+
+
+def inputs_to_array(inputs: Dict[str, float]) -> np.ndarray:
+    """Pack an inputs dict into a float64 array in REQUIRED_KEYS order (missing or None -> 0)."""
+    return np.array([float(inputs.get(k, 0) or 0) for k in REQUIRED_KEYS], dtype=np.float64)
@@ -8,14 +8,27 @@ C. Provenance is present and non-empty for extractions
 D. KPI totals differ when inputs differ
 """
 
+import gc
+import io
 import os
 import pytest
+import weakref
 from extraction_core import (
     extract_required_inputs,
+    extract_all_models,
     compute_kpis,
+    compute_kpis_batch,
+    inputs_to_array,
+    KPI_KEYS,
     parse_numeric_with_unit,
     find_anchor_value,
+    extract_table_value,
+    detect_header_row,
     detect_model_sheets,
+    list_sheet_names,
+    load_single_sheet,
+    load_workbook_sheets,
+    content_digest,
     Provenance,
 )
 import pandas as pd
@@ -53,10 +66,18 @@ class TestParseNumericWithUnit:
         val, _ = parse_numeric_with_unit("385,5")
         assert val == 385.5
     
+    def test_comma_decimal_with_unit(self):
+        val, _ = parse_numeric_with_unit("385,5 kWh/año")
+        assert val == 385.5
+    
     def test_thousand_separator(self):
         val, _ = parse_numeric_with_unit("1,200")
         assert val == 1200.0
     
+    def test_negative_plain_string(self):
+        val, _ = parse_numeric_with_unit("-4.5")
+        assert val == -4.5
+    
     def test_none_value(self):
         val, _ = parse_numeric_with_unit(None)
         assert val is None
@@ -64,6 +85,39 @@ class TestParseNumericWithUnit:
     def test_empty_string(self):
         val, _ = parse_numeric_with_unit("")
         assert val is None
+    
+    def test_bool_is_not_numeric(self):
+        """Typed TRUE/FALSE cells parse like their text, to no number."""
+        assert parse_numeric_with_unit(True) == (None, "True")
+        assert parse_numeric_with_unit(False)[0] is None
+
+
+class TestFindAnchorValue:
+    """Tests for find_anchor_value on in-memory sheets."""
+    
+    def test_value_right_of_label(self):
+        df = pd.DataFrame([["Notes", None, None], ["Annual  Energy Consumption", "n/a", "409.6 kWh"]])
+        val, prov = find_anchor_value(df, ["annual energy consumption"], "Sheet")
+        assert val == 409.6
+        assert prov.cell_ref == "C2"
+        assert prov.confidence == 0.9
+    
+    def test_value_below_label(self):
+        df = pd.DataFrame([["Transport CO2", None], ["4,5", None]])
+        val, prov = find_anchor_value(df, ["transport co2"], "Sheet")
+        assert val == 4.5
+        assert prov.cell_ref == "A2"
+    
+    def test_earlier_anchor_wins_over_earlier_cell(self):
+        """Anchors are tried in list order, even if a later anchor appears first."""
+        df = pd.DataFrame([["energy use", 100], ["annual consumption", 200]])
+        val, prov = find_anchor_value(df, ["annual consumption", "energy use"], "Sheet")
+        assert val == 200
+        assert prov.cell_ref == "B2"
+    
+    def test_no_match(self):
+        df = pd.DataFrame([["Model", "SMG6527"]])
+        assert find_anchor_value(df, ["transport co2"], "Sheet") == (None, None)
 
 
 # ============================================================================
@@ -101,6 +155,16 @@ class TestDifferentSheetsDifferentValues:
         # Values should be close to expected
         assert 400 < kwh_smg < 420, f"SMG kWh should be ~409.6, got {kwh_smg}"
         assert 240 < kwh_gtd < 250, f"GTD kWh should be ~245, got {kwh_gtd}"
+    
+    def test_extract_all_models_matches_per_sheet(self, ensure_fixtures):
+        workbook = read_fixture("dryer_workbook.xlsx")
+        sheets = ["Dryer SMG (SMG6527)", "Dryer GTD (GTD42XXX)"]
+        f = io.BytesIO(workbook)
+        results = extract_all_models(f, sheets)
+        assert list(results) == sheets
+        assert f.tell() == 0
+        for sheet in sheets:
+            assert results[sheet].inputs == extract_required_inputs(workbook, sheet).inputs
 
 
 class TestDifferentWorkbooksDifferentValues:
@@ -153,6 +217,49 @@ class TestKPIDiffers:
             "SMG (409.6 kWh) should have higher CO2e than GTD (245 kWh)"
 
 
+class TestComputeKpis:
+    """Unit tests for compute_kpis."""
+    
+    def test_use_phase_and_shares(self):
+        inputs = {"Transport_kgCO2e": 5.0, "Materials_kgCO2e": 100.0, "Production_kgCO2e": 25.0, "Use_kWh_per_year": 200.0}
+        kpis = compute_kpis(inputs, grid_factor=0.25, lifetime=10)
+        assert kpis["UsePhase_CO2e"] == 500.0
+        assert kpis["Total_CO2e"] == 630.0
+        assert kpis["Share_Use_%"] == 79.4
+    
+    def test_repeat_calls_return_independent_dicts(self):
+        """Results are memoized, so callers must get a fresh dict each time."""
+        inputs = {"Use_kWh_per_year": 100.0}
+        first = compute_kpis(inputs, 0.25, 10)
+        first["Total_CO2e"] = -1
+        assert compute_kpis(inputs, 0.25, 10)["Total_CO2e"] == 250.0
+    
+    def test_inputs_to_array_order(self):
+        """Arrays follow REQUIRED_KEYS order; missing and None become 0."""
+        arr = inputs_to_array({"Use_kWh_per_year": 322.0, "Transport_kgCO2e": None, "Materials_kgCO2e": 85.2})
+        assert arr.tolist() == [0.0, 85.2, 0.0, 322.0]
+    
+    def test_batch_matches_scalar(self):
+        rows = [
+            {"Transport_kgCO2e": 5.0, "Materials_kgCO2e": 100.0, "Production_kgCO2e": 25.0, "Use_kWh_per_year": 200.0},
+            {"Use_kWh_per_year": 409.6},
+            {},
+        ]
+        batch = compute_kpis_batch([inputs_to_array(r) for r in rows], 0.42, 12)
+        assert batch.shape == (3, len(KPI_KEYS))
+        for inputs, values in zip(rows, batch.tolist()):
+            kpis = compute_kpis(inputs, 0.42, 12)
+            assert list(kpis) == KPI_KEYS
+            assert [kpis[k] for k in KPI_KEYS] == [round(v, 1 if k.startswith("Share_") else 2) for k, v in zip(KPI_KEYS, values)]
+    
+    def test_batch_rejects_misshaped_inputs(self):
+        """A single row of 4 is accepted; anything not (N, 4) is not reinterpreted."""
+        assert compute_kpis_batch([5.0, 100.0, 25.0, 200.0], 0.42, 12).shape == (1, len(KPI_KEYS))
+        for bad in ([1.0] * 8, [[1.0, 2.0]] * 4, [[[1.0] * 4]]):
+            with pytest.raises(ValueError):
+                compute_kpis_batch(bad, 0.42, 12)
+
+
 class TestProvenancePresent:
     """C: Provenance is present and non-empty for extractions."""
     
@@ -195,6 +302,22 @@ class TestTableFormatExtraction:
         assert 170 < kwh < 180, f"Table extraction should get first row ~175.5, got {kwh}"
 
 
+class TestDetectHeaderRow:
+    """Test header row scoring."""
+    
+    def test_row_with_most_keyword_hits_wins(self):
+        df = pd.DataFrame([
+            ["Product list", None, None],
+            ["Transport", "Production", None],
+            ["Name", "Materials", "Factory"],  # "materials" also hits "material"
+        ])
+        assert detect_header_row(df) == 2
+    
+    def test_no_keywords_defaults_to_first_row(self):
+        df = pd.DataFrame([["a", 1], ["b", 2]])
+        assert detect_header_row(df) == 0
+
+
 class TestSpanishLabels:
     """Test extraction with Spanish anchor labels."""
     
@@ -229,6 +352,109 @@ class TestModelSheetDetection:
         assert "Cooling Unit (GSS25XXX)" in detected
 
 
+class TestSheetLoading:
+    """Test the sheet-name listing and single-sheet fast paths."""
+    
+    def test_list_sheet_names(self, ensure_fixtures):
+        """Sheet names should come back in workbook order."""
+        workbook = read_fixture("dryer_workbook.xlsx")
+        assert list_sheet_names(workbook) == ["Summary", "Dryer SMG (SMG6527)", "Dryer GTD (GTD42XXX)"]
+    
+    def test_name_filter_skips_sheets(self, ensure_fixtures):
+        """Only sheets accepted by name_filter should be loaded."""
+        workbook = read_fixture("dryer_workbook.xlsx")
+        sheets = load_workbook_sheets(workbook, name_filter=lambda name: name.startswith("Dryer"))
+        assert list(sheets) == ["Dryer SMG (SMG6527)", "Dryer GTD (GTD42XXX)"]
+    
+    def test_preloaded_sheet_matches_bytes(self, ensure_fixtures):
+        """Extracting from a pre-loaded sheet should match extracting from bytes."""
+        workbook = read_fixture("dryer_workbook.xlsx")
+        sheet = "Dryer GTD (GTD42XXX)"
+        
+        df = load_single_sheet(workbook, sheet)
+        from_frame = extract_required_inputs(df, sheet)
+        from_bytes = extract_required_inputs(workbook, sheet)
+        
+        assert from_frame.to_dict() == from_bytes.to_dict()
+    
+    def test_empty_margins_do_not_change_result(self, ensure_fixtures):
+        """Trailing blank rows/columns (inflated used ranges) are ignored."""
+        workbook = read_fixture("dryer_workbook.xlsx")
+        sheet = "Dryer SMG (SMG6527)"
+        
+        df = load_single_sheet(workbook, sheet)
+        padded = df.reindex(index=range(len(df) + 50), columns=range(df.shape[1] + 20))
+        
+        assert extract_required_inputs(padded, sheet).to_dict() == extract_required_inputs(df, sheet).to_dict()
+    
+    def test_blank_sheet_reports_failures(self):
+        """A sheet with no values yields failed provenance instead of raising."""
+        result = extract_required_inputs(pd.DataFrame([[None, None], [None, None]]), "Blank")
+        assert all(p.method == "failed" for p in result.provenance.values())
+    
+    def test_missing_sheet_raises(self, ensure_fixtures):
+        """Unknown sheet names should raise KeyError."""
+        workbook = read_fixture("dryer_workbook.xlsx")
+        with pytest.raises(KeyError):
+            load_single_sheet(workbook, "No Such Sheet")
+    
+    def test_bool_cell_is_not_a_value(self):
+        """A typed TRUE cell next to an anchor is skipped, not read as 1.0."""
+        df = pd.DataFrame([["Annual energy consumption", True, "409 kWh"], ["note", "yes", None]])
+        val, prov = find_anchor_value(df, ["annual energy consumption"], "Sheet")
+        assert val == 409.0
+        assert prov.cell_ref == "C1"
+    
+    def test_bool_skipped_in_table_column(self):
+        df = pd.DataFrame({"Use kWh": [True, 200]})
+        val, prov = extract_table_value(df, 0, "Sheet", "Use_kWh_per_year")
+        assert val == 200
+        assert prov.cell_ref == "A3"
+    
+    def test_missing_sheet_warning_lists_sheets(self, ensure_fixtures):
+        workbook = read_fixture("dryer_workbook.xlsx")
+        result = extract_required_inputs(workbook, "No Such Sheet")
+        assert "Dryer SMG (SMG6527)" in result.warnings[0]
+    
+    def test_cached_sheet_is_not_shared(self, ensure_fixtures):
+        """Parses are cached per content; callers still get their own frame."""
+        workbook = read_fixture("dryer_workbook.xlsx")
+        first = load_single_sheet(workbook, "Dryer SMG (SMG6527)")
+        first.iloc[:, :] = None
+        second = load_single_sheet(io.BytesIO(workbook), "Dryer SMG (SMG6527)")
+        assert second.notna().any().any()
+    
+    def test_file_source_left_rewound(self, ensure_fixtures):
+        """A cache hit on a file object still leaves it readable from the start."""
+        f = io.BytesIO(read_fixture("dryer_workbook.xlsx"))
+        load_single_sheet(f, "Summary")
+        load_single_sheet(f, "Summary")
+        assert f.tell() == 0
+    
+    def test_precomputed_digest_matches(self, ensure_fixtures):
+        """Passing content_digest() through gives the same result as hashing inside."""
+        workbook = read_fixture("dryer_workbook.xlsx")
+        sheet = "Dryer GTD (GTD42XXX)"
+        with_digest = extract_required_inputs(io.BytesIO(workbook), sheet, digest=content_digest(workbook))
+        assert with_digest.to_dict() == extract_required_inputs(workbook, sheet).to_dict()
+    
+    def test_cache_does_not_keep_source_alive(self, ensure_fixtures):
+        """Cached parses are keyed by content digest, not by the source object."""
+        f = io.BytesIO(read_fixture("dryer_workbook.xlsx"))
+        load_single_sheet(f, "Summary")
+        ref = weakref.ref(f)
+        del f
+        gc.collect()
+        assert ref() is None
+    
+    def test_all_sheets_loaded_then_cached(self, ensure_fixtures):
+        """Sheets from load_workbook_sheets match one-off loads of the same sheet."""
+        workbook = read_fixture("dryer_workbook.xlsx")
+        sheets = load_workbook_sheets(workbook)
+        for name, df in sheets.items():
+            assert load_single_sheet(workbook, name).equals(df)
+
+
 # ============================================================================
 # Smoke Test for Full Workflow
 # ============================================================================
@@ -0,0 +1,73 @@
+"""
+theme.py - Design tokens and the global stylesheet for the Streamlit app.
+
+Streamlit re-executes app.py on every widget interaction, but imported
+modules stay cached in sys.modules, so the stylesheet is interpolated once
+per process instead of on every rerun.
+"""
+
+BG = "#051C2C"
+ACCENT = "#00D4FF"
+TEXT = "#FFFFFF"
+TEXT_DIM = "rgba(255,255,255,0.7)"
+TEXT_MUTED = "rgba(255,255,255,0.5)"
+BORDER = "rgba(255,255,255,0.08)"
+CARD = "rgba(255,255,255,0.03)"
+
+CSS_HTML = f"""
+<style>
+@import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&family=Playfair+Display:wght@600;700&display=swap');
+
+.stApp {{ background-color: {BG}; }}
+.main .block-container {{ background-color: {BG}; padding-top: 2rem; }}
+
+h1 {{ font-family: 'Playfair Display', serif !important; color: {TEXT} !important; font-weight: 700 !important; }}
+h2, h3, h4 {{ font-family: 'Inter', sans-serif !important; color: {TEXT} !important; font-weight: 600 !important; }}
+p, span, label, .stMarkdown {{ font-family: 'Inter', sans-serif !important; color: {TEXT_DIM} !important; }}
+
+.step-header {{ display: flex; align-items: center; gap: 12px; margin: 1.5rem 0 1rem 0; }}
+.step-num {{ background: {ACCENT}; color: {BG}; width: 32px; height: 32px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-weight: 700; font-size: 14px; }}
+.step-title {{ font-family: 'Playfair Display', serif; font-size: 24px; font-weight: 600; color: {TEXT}; }}
+
+.input-label {{ font-family: 'Inter', sans-serif; font-size: 15px; font-weight: 600; color: {TEXT}; margin-bottom: 6px; display: flex; align-items: center; gap: 10px; }}
+.badge-ok {{ background: rgba(0, 212, 255, 0.15); color: {ACCENT}; padding: 3px 10px; border-radius: 12px; font-size: 12px; font-weight: 600; }}
+.badge-manual {{ background: rgba(255, 170, 0, 0.15); color: #FFAA00; padding: 3px 10px; border-radius: 12px; font-size: 12px; font-weight: 600; }}
+
+[data-testid="stMetricValue"] {{ color: {TEXT} !important; font-family: 'Playfair Display', serif !important; font-size: 2rem !important; }}
+[data-testid="stMetricLabel"] {{ color: {TEXT_MUTED} !important; font-family: 'Inter', sans-serif !important; text-transform: uppercase; font-size: 12px !important; }}
+
+.stButton > button {{ background: {ACCENT} !important; color: {BG} !important; border: none !important; border-radius: 8px !important; font-weight: 600 !important; transition: all 0.3s ease !important; }}
+.stButton > button:hover {{ background: #33DFFF !important; box-shadow: 0 0 25px rgba(0, 212, 255, 0.3) !important; transform: translateY(-2px) !important; }}
+
+.stDownloadButton > button {{ background: {CARD} !important; color: {TEXT} !important; border: 1px solid {BORDER} !important; border-radius: 8px !important; font-weight: 600 !important; }}
+.stDownloadButton > button:hover {{ border-color: {ACCENT} !important; color: {ACCENT} !important; }}
+
+[data-testid="stFileUploader"] {{ background: {CARD}; border: 2px dashed {BORDER}; border-radius: 12px; padding: 1rem; }}
+[data-testid="stFileUploader"]:hover {{ border-color: {ACCENT}; }}
+[data-testid="stFileUploader"] button {{ background: #4a5568 !important; color: white !important; border: none !important; border-radius: 6px !important; }}
+[data-testid="stFileUploader"] button:hover {{ background: #5a6578 !important; }}
+[data-testid="stFileUploader"] section {{ color: {TEXT_DIM} !important; }}
+[data-testid="stFileUploader"] small {{ color: {TEXT_MUTED} !important; }}
+
+.stSelectbox > div > div {{ background: {CARD} !important; border: 1px solid {BORDER} !important; border-radius: 8px !important; color: {TEXT} !important; }}
+.stSelectbox label {{ color: {TEXT_DIM} !important; }}
+.stNumberInput > div > div > input {{ background: {CARD} !important; border: 1px solid {BORDER} !important; border-radius: 8px !important; color: {TEXT} !important; }}
+.stNumberInput label {{ color: {TEXT_DIM} !important; }}
+.stRadio > label {{ color: {TEXT_DIM} !important; }}
+
+hr {{ border-color: {BORDER} !important; margin: 2rem 0 !important; }}
+
+.info-box {{ background: {CARD}; border-left: 3px solid {ACCENT}; border-radius: 0 8px 8px 0; padding: 1rem; color: {TEXT_DIM}; }}
+.info-box strong {{ color: {TEXT}; }}
+
+.warning-box {{ background: rgba(255, 170, 0, 0.08); border: 1px solid rgba(255, 170, 0, 0.3); border-radius: 8px; padding: 0.75rem 1rem; color: #FFAA00; font-size: 13px; margin-bottom: 1rem; }}
+
+.energy-bar {{ display: flex; width: 100%; border-radius: 6px; overflow: hidden; margin-top: 0.5rem; }}
+.energy-seg {{ flex: 1; text-align: center; padding: 12px 0; font-weight: 700; font-size: 1.1rem; transition: all 0.3s ease; }}
+.energy-seg.active {{ box-shadow: 0 0 20px rgba(0, 212, 255, 0.5); transform: scale(1.08); z-index: 10; }}
+.energy-arrow {{ text-align: center; font-size: 1.5rem; margin-bottom: -8px; color: {TEXT}; }}
+
+.footer {{ text-align: center; padding: 2rem 0 1rem 0; color: {TEXT_MUTED}; font-size: 13px; }}
+.footer a {{ color: {ACCENT}; text-decoration: none; }}
+</style>
+"""